@@ -2,66 +2,176 @@ import multiprocessing
 import time
 import argparse
 import psutil   # install with: pip install psutil
+import numpy as np   # install with: pip install numpy
 import signal
 import sys
 import os
 import logging
 import threading
-import random
+import ctypes
+import shutil
+from multiprocessing import shared_memory
 from datetime import datetime
 
+try:
+    from numba import njit   # optional, install with: pip install numba
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
 
-def cpu_burn(intensity=1):
+BYTES_PER_GB = 1024 ** 3
+
+# Width of the float64 buffer each CPU worker burns on
+BURN_WIDTH = 64
+
+
+def make_burn_kernel(intensity):
+    """Build a burn pass with the iteration count for one intensity level baked in"""
+    n = 100000 * intensity
+    # mul/div are passed in at runtime so fastmath cannot fold them to 1.0
+    if HAVE_NUMBA:
+        # Constant trip counts let LLVM fully vectorize the inner loop without a remainder
+        source = (
+            "def burn_pass(x_buf, mul, div):\n"
+            f"    for _ in range({n}):\n"
+            f"        for j in range({BURN_WIDTH}):\n"
+            "            x_buf[j] = x_buf[j] * mul / div\n"
+        )
+        namespace = {}
+        exec(compile(source, f"<burn_pass intensity={intensity}>", 'exec'), namespace)
+        burn_pass = njit(nogil=True, fastmath=True, boundscheck=False)(namespace['burn_pass'])
+        burn_pass.compile("(float64[::1], float64, float64)")
+        return burn_pass
+    
+    def burn_pass(x_buf, mul, div):
+        """Vectorized multiply passes over the whole buffer, one ufunc call each"""
+        c1 = np.float64(mul)
+        c2 = np.float64(1.0 / div)
+        for _ in range(n):
+            np.multiply(x_buf, c1, out=x_buf)
+            np.multiply(x_buf, c2, out=x_buf)
+    return burn_pass
+
+
+def cpu_burn(intensity=1, burn_pass=None):
     """CPU-intensive workload function"""
+    if burn_pass is None:
+        burn_pass = make_burn_kernel(intensity)
+    x_buf = np.ones(BURN_WIDTH, dtype=np.float64)
+    rng = np.random.default_rng()
+    noise = rng.random(size=intensity * 10)
+    k = 0
     while True:
-        x = 1.0
-        for _ in range(100000 * intensity):
-            x *= 1.000001
-            x /= 1.000001
-            # Add some variety to prevent optimization
-            if _ % 10000 == 0:
-                x += random.random() * 0.001
+        burn_pass(x_buf, 1.000001, 1.000001)
+        # Keep the buffer observable so the loop is never optimized away
+        x_buf[0] += noise[k] * 1e-300
+        k = (k + 1) % noise.size
 
 
-def memory_burn(size_mb=100):
+def _churn_region(region, chunk_size):
+    """Keep rewriting a byte region in place, one chunk at a time"""
+    views = [region[i:i + chunk_size] for i in range(0, region.size, chunk_size)]
+    fill_views = [view.view(np.float64) for view in views]
+    modify_idx = np.arange(0, chunk_size, 5000)
+    rng = np.random.default_rng()
+    
+    while True:
+        # Overwrite every chunk with random data to prevent optimization
+        for fill_view in fill_views:
+            rng.random(out=fill_view)
+        
+        # Modify existing data in place, drawing all the random bytes in one batch
+        k = min(10, len(views))
+        rand_batch = rng.integers(0, 256, size=(k, modify_idx.size), dtype=np.uint8)
+        for j, values in zip(rng.integers(0, len(views), size=k), rand_batch):
+            views[j][modify_idx] = values
+            
+        time.sleep(0.1)  # Small delay to prevent complete system freeze
+
+
+def memory_burn(size_mb=100, shm_name=None, offset=0):
     """Memory-intensive workload function"""
+    shm = None
     try:
-        # Allocate and manipulate memory
-        data = []
+        # Work on a fixed region, either this worker's slice of a shared segment or a private buffer
         chunk_size = 1024 * 1024  # 1MB chunks
-        
-        while True:
-            # Allocate memory
-            for _ in range(size_mb):
-                chunk = bytearray(chunk_size)
-                # Fill with random data to prevent optimization
-                for i in range(0, len(chunk), 1000):
-                    chunk[i] = random.randint(0, 255)
-                data.append(chunk)
-            
-            # Modify existing data
-            if data:
-                for chunk in random.sample(data, min(10, len(data))):
-                    for i in range(0, len(chunk), 5000):
-                        chunk[i] = random.randint(0, 255)
-            
-            # Occasionally clear some data to prevent infinite growth
-            if len(data) > size_mb * 2:
-                data = data[size_mb:]
-                
-            time.sleep(0.1)  # Small delay to prevent complete system freeze
+        region_size = size_mb * chunk_size
+        if shm_name is not None:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            # Unwind on terminate() so the handle gets closed below
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+            region = np.frombuffer(shm.buf, dtype=np.uint8, count=region_size, offset=offset)
+        else:
+            region = np.frombuffer(bytearray(region_size), dtype=np.uint8)
+        _churn_region(region, chunk_size)
             
+    except SystemExit:
+        pass  # Terminated
     except Exception as e:
         print(f"Memory stress error: {e}")
+    
+    # Closed only once the exception is cleared, as its traceback still references the views
+    if shm is not None:
+        region = None
+        shm.close()
+
+
+def _exit_with_parent():
+    """Have the kernel kill this worker when the tester dies (Linux only)"""
+    PR_SET_PDEATHSIG = 1
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.prctl(PR_SET_PDEATHSIG, signal.SIGKILL)
+    except (OSError, AttributeError):
+        return
+    # The tester may have died before prctl() took effect
+    parent = multiprocessing.parent_process()
+    if parent is not None and os.getppid() != parent.pid:
+        os._exit(1)
+
+
+def _worker_main(target, *args):
+    """Entry point for stress worker processes"""
+    # Workers run in their own process group, so a kill aimed at the tester's job
+    # group would miss them; tie their lifetime to the tester instead
+    if sys.platform.startswith('linux'):
+        _exit_with_parent()
+    # Forked workers inherit the tester's signal handlers; the parent owns shutdown,
+    # so ignore Ctrl+C here and let terminate() stop the worker directly
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+    target(*args)
+
+
+def _thread_siblings(cpu):
+    """Get the logical CPUs sharing a physical core with cpu, or None if unknown"""
+    path = f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list"
+    try:
+        with open(path) as f:
+            text = f.read().strip()
+    except OSError:
+        return None  # No sysfs topology (non-Linux)
+    siblings = set()
+    for part in text.split(','):
+        if '-' in part:
+            first, last = part.split('-')
+            siblings.update(range(int(first), int(last) + 1))
+        else:
+            siblings.add(int(part))
+    return frozenset(siblings)
 
 
 def get_system_info():
     """Get comprehensive system information"""
+    memory = psutil.virtual_memory()
     info = {
         'cpu_count': psutil.cpu_count(logical=False),
         'cpu_count_logical': psutil.cpu_count(logical=True),
-        'memory_total': psutil.virtual_memory().total / (1024**3),  # GB
-        'memory_available': psutil.virtual_memory().available / (1024**3),  # GB
+        'memory_total': memory.total / BYTES_PER_GB,  # GB
+        'memory_available': memory.available / BYTES_PER_GB,  # GB
         'platform': sys.platform
     }
     return info
@@ -71,9 +181,34 @@ class CPUStressTester:
     def __init__(self):
         self.processes = []
         self.memory_processes = []
+        self.shared_memory = None
+        self._pgid = None  # process group shared by all forked workers
         self.running = True
+        self.completed = False
+        self._stop_event = threading.Event()
+        # fork starts workers without re-importing this module; elsewhere keep the platform
+        # default, since forked children can crash on macOS system frameworks
+        self._mp_context = multiprocessing.get_context('fork' if sys.platform.startswith('linux') else None)
+        self._min_interval = 0.5  # seconds between psutil samples
+        self._last_sample_t = 0.0
+        self._last_sample = None
+        self._temp_interval = 5.0  # temperatures change slowly; rescan every 5th 1s refresh
+        self._last_temp_t = 0.0
+        self._last_temp = None
+        # Prebuilt usage bars, indexed by fill level (0-20 chars, 5% each)
+        self._bars = ["█" * i + "░" * (20 - i) for i in range(21)]
+        # Redirected output (CI, tee, log files) gets a log line per tick instead of a redrawn screen
+        self._tty = sys.stdout.isatty()
+        # Installed RAM never changes during a run
+        self._mem_total_gb = psutil.virtual_memory().total / BYTES_PER_GB
         self.setup_logging()
         self.setup_signal_handlers()
+        if os.name == 'nt':  # Windows
+            os.system('')  # Enables ANSI escape handling in the Windows 10+ console
+        # Prime the CPU counters so later non-blocking reads return deltas
+        psutil.cpu_percent(percpu=True, interval=None)
+        # Captured before any pinning, which would narrow the affinity of this process
+        self._worker_cores = self.get_affinity_cores()
     
     def setup_logging(self):
         """Setup logging configuration"""
@@ -94,6 +229,8 @@ class CPUStressTester:
         signal.signal(signal.SIGINT, self.signal_handler)
         if hasattr(signal, 'SIGTERM'):
             signal.signal(signal.SIGTERM, self.signal_handler)
+        if hasattr(signal, 'SIGHUP'):  # Terminal closed
+            signal.signal(signal.SIGHUP, self.signal_handler)
     
     def signal_handler(self, signum, frame):
         """Handle interrupt signals gracefully"""
@@ -103,10 +240,27 @@ class CPUStressTester:
         self.cleanup_processes()
         sys.exit(0)
 
+    def stop_on_timeout(self):
+        """Stop the stress test once its duration has elapsed"""
+        self.completed = True
+        self.running = False
+        self._stop_event.set()
+
     def cleanup_processes(self):
         """Clean up all running processes"""
         all_processes = self.processes + self.memory_processes
         
+        if self._pgid is not None:
+            # Signal every worker at once, then escalate after one shared 2 second grace period
+            self.signal_process_group(signal.SIGTERM)
+            deadline = time.time() + 2
+            for p in all_processes:
+                p.join(timeout=max(0, deadline - time.time()))
+            if any(p.is_alive() for p in all_processes):
+                self.signal_process_group(signal.SIGKILL)
+            self._pgid = None
+        
+        # Stop anything left over individually (Windows, or workers outside the group)
         for p in all_processes:
             if p.is_alive():
                 try:
@@ -120,10 +274,55 @@ class CPUStressTester:
         
         self.processes.clear()
         self.memory_processes.clear()
+        
+        if self.shared_memory is not None:
+            try:
+                self.shared_memory.close()
+                self.shared_memory.unlink()
+            except Exception as e:
+                self.logger.error(f"Error releasing shared memory: {e}")
+            self.shared_memory = None
         self.logger.info("All processes cleaned up")
 
+    def add_to_process_group(self, pid):
+        """Move a forked worker into the workers' process group"""
+        if self._mp_context.get_start_method() != 'fork':
+            return
+        try:
+            # The first worker becomes the group leader
+            os.setpgid(pid, self._pgid or pid)
+            if self._pgid is None:
+                self._pgid = pid
+        except OSError as e:
+            self.logger.warning(f"Could not add process {pid} to the worker process group: {e}")
+
+    def signal_process_group(self, signum):
+        """Send a signal to every worker in the process group"""
+        try:
+            os.killpg(self._pgid, signum)
+        except ProcessLookupError:
+            pass  # All workers have already exited
+        except OSError as e:
+            self.logger.error(f"Error signalling worker process group: {e}")
+
+    def get_system_metrics(self):
+        """Get CPU and memory metrics, reusing the last sample if it is recent"""
+        now = time.time()
+        if self._last_sample is None or now - self._last_sample_t >= self._min_interval:
+            # Non-blocking read: deltas since the previous sample; overall usage is the per-core mean
+            cpu_per_core = psutil.cpu_percent(percpu=True, interval=None)
+            cpu_usage = sum(cpu_per_core) / len(cpu_per_core) if cpu_per_core else 0.0
+            memory = psutil.virtual_memory()
+            self._last_sample = (cpu_usage, cpu_per_core, memory)
+            self._last_sample_t = now
+        return self._last_sample
+
     def get_temperature_info(self):
         """Get temperature information with cross-platform compatibility"""
+        now = time.time()
+        if self._last_temp is not None and now - self._last_temp_t < self._temp_interval:
+            return self._last_temp
+        
         temp_info = []
         try:
             if hasattr(psutil, 'sensors_temperatures'):
@@ -140,6 +339,8 @@ class CPUStressTester:
         except Exception as e:
             temp_info.append(f"Temperature reading error: {e}")
         
+        self._last_temp = temp_info
+        self._last_temp_t = now
         return temp_info
 
     def display_dashboard(self, start_time, cpu_cores, memory_size, intensity):
@@ -148,67 +349,130 @@ class CPUStressTester:
         
         # Get system metrics
         try:
-            cpu_usage = psutil.cpu_percent(interval=0.1)
-            cpu_per_core = psutil.cpu_percent(percpu=True, interval=0.1)
-            memory = psutil.virtual_memory()
+            cpu_usage, cpu_per_core, memory = self.get_system_metrics()
             
-            # Clear screen for dashboard effect (cross-platform)
-            if os.name == 'nt':  # Windows
-                os.system('cls')
-            else:  # Unix/Linux/macOS
-                os.system('clear')
-            
-            print("=" * 60)
-            print("🔥 CPU & MEMORY STRESS TESTER DASHBOARD 🔥")
-            print("=" * 60)
-            print(f"⏱️  Elapsed Time: {elapsed:.1f}s")
-            print(f"🔧 CPU Cores Stressed: {cpu_cores}")
-            print(f"💾 Memory Stress Size: {memory_size}MB per process")
-            print(f"⚡ Intensity Level: {intensity}")
-            print("-" * 60)
+            summary = f"Elapsed: {elapsed:.1f}s, CPU: {cpu_usage:.1f}%, Memory: {memory.percent:.1f}%"
+            if not self._tty:
+                self.logger.info(summary)
+                return
+            
+            lines = []
+            lines.append("=" * 60)
+            lines.append("🔥 CPU & MEMORY STRESS TESTER DASHBOARD 🔥")
+            lines.append("=" * 60)
+            lines.append(f"⏱️  Elapsed Time: {elapsed:.1f}s")
+            lines.append(f"🔧 CPU Cores Stressed: {cpu_cores}")
+            lines.append(f"💾 Memory Stress Size: {memory_size}MB per process")
+            lines.append(f"⚡ Intensity Level: {intensity}")
+            lines.append("-" * 60)
             
             # CPU Information
-            print(f"🖥️  Overall CPU Usage: {cpu_usage:.1f}%")
-            print("📊 Per-Core Usage:")
+            lines.append(f"🖥️  Overall CPU Usage: {cpu_usage:.1f}%")
+            lines.append("📊 Per-Core Usage:")
             for i, usage in enumerate(cpu_per_core):
-                bar_length = int(usage / 5)  # Scale to 20 chars max
-                bar = "█" * bar_length + "░" * (20 - bar_length)
-                print(f"   Core {i:2d}: [{bar}] {usage:5.1f}%")
+                bar = self._bars[min(20, int(usage / 5))]  # Scale to 20 chars max
+                lines.append(f"   Core {i:2d}: [{bar}] {usage:5.1f}%")
             
-            print("-" * 60)
+            lines.append("-" * 60)
             
             # Memory Information
-            print(f"🧠 Memory Usage: {memory.percent:.1f}%")
-            print(f"📈 Used: {memory.used / (1024**3):.2f}GB / {memory.total / (1024**3):.2f}GB")
-            memory_bar_length = int(memory.percent / 5)
-            memory_bar = "█" * memory_bar_length + "░" * (20 - memory_bar_length)
-            print(f"   Memory: [{memory_bar}] {memory.percent:.1f}%")
+            lines.append(f"🧠 Memory Usage: {memory.percent:.1f}%")
+            lines.append(f"📈 Used: {memory.used / BYTES_PER_GB:.2f}GB / {self._mem_total_gb:.2f}GB")
+            memory_bar = self._bars[min(20, int(memory.percent / 5))]
+            lines.append(f"   Memory: [{memory_bar}] {memory.percent:.1f}%")
             
-            print("-" * 60)
+            lines.append("-" * 60)
             
             # Temperature Information
             temp_info = self.get_temperature_info()
-            print("🌡️  Temperature Information:")
+            lines.append("🌡️  Temperature Information:")
             for temp in temp_info:
-                print(f"   {temp}")
+                lines.append(f"   {temp}")
+            
+            lines.append("-" * 60)
+            lines.append("Press Ctrl+C to stop the stress test gracefully")
+            lines.append("=" * 60)
             
-            print("-" * 60)
-            print("Press Ctrl+C to stop the stress test gracefully")
-            print("=" * 60)
+            # Clear screen and move the cursor home with ANSI escapes (no shell fork),
+            # then draw the whole dashboard in a single write
+            sys.stdout.write("\033[2J\033[H" + "\n".join(lines) + "\n")
+            sys.stdout.flush()
             
             # Log metrics
-            self.logger.info(f"Elapsed: {elapsed:.1f}s, CPU: {cpu_usage:.1f}%, Memory: {memory.percent:.1f}%")
+            self.logger.info(summary)
             
         except Exception as e:
             print(f"Dashboard error: {e}")
             self.logger.error(f"Dashboard error: {e}")
 
+    def get_affinity_cores(self):
+        """Get the CPUs workers can be pinned to, one thread per physical core first"""
+        try:
+            allowed = psutil.Process().cpu_affinity()
+        except (AttributeError, psutil.Error, OSError):
+            # cpu_affinity() is not available on macOS
+            if hasattr(os, 'sched_getaffinity'):
+                allowed = sorted(os.sched_getaffinity(0))
+            else:
+                return []
+        if not allowed:
+            return []
+        
+        # Group the allowed CPUs by physical core, then take one thread from every core
+        # before any second thread, so workers only share a core once every core is busy
+        cores = {}
+        for cpu in sorted(allowed):
+            cores.setdefault(_thread_siblings(cpu) or frozenset([cpu]), []).append(cpu)
+        threads = list(cores.values())
+        ordered = []
+        for rank in range(max(len(t) for t in threads)):
+            ordered.extend(t[rank] for t in threads if rank < len(t))
+        return ordered
+
+    def pin_process(self, pid, core_id):
+        """Bind a worker process to a single CPU"""
+        try:
+            psutil.Process(pid).cpu_affinity([core_id])
+        except AttributeError:
+            if hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(pid, {core_id})
+                except OSError as e:
+                    self.logger.warning(f"Could not pin process {pid} to core {core_id}: {e}")
+        except (psutil.Error, OSError) as e:
+            self.logger.warning(f"Could not pin process {pid} to core {core_id}: {e}")
+
+    def reserve_monitor_core(self, workers):
+        """Take a core out of the workers' list for the tester and its monitor thread"""
+        # Only when a whole physical core would otherwise sit idle; a test that needs every
+        # physical core keeps them all for workers rather than pushing one onto a sibling thread
+        physical = len({_thread_siblings(cpu) or frozenset([cpu]) for cpu in self._worker_cores})
+        if physical > 1 and workers < physical:
+            monitor_core = self._worker_cores[0]
+            self._worker_cores = self._worker_cores[1:]
+            return monitor_core
+        return None
+
+    def monitor_loop(self, start_time, cpu_cores, memory_size, intensity):
+        """Refresh the dashboard about once a second until the test stops"""
+        while self.running:
+            self.display_dashboard(start_time, cpu_cores, memory_size, intensity)
+            self._stop_event.wait(1)
+
     def stress_cpu(self, cores, duration, intensity):
         """Start CPU stress testing"""
         try:
-            for _ in range(cores):
-                p = multiprocessing.Process(target=cpu_burn, args=(intensity,))
+            # Compile the kernel once here so forked workers inherit it instead of each
+            # compiling their own; spawned workers cannot receive it and build it themselves
+            burn_pass = make_burn_kernel(intensity) if self._mp_context.get_start_method() == 'fork' else None
+            
+            affinity_cores = self._worker_cores
+            for idx in range(cores):
+                p = self._mp_context.Process(target=_worker_main, args=(cpu_burn, intensity, burn_pass))
                 p.start()
+                self.add_to_process_group(p.pid)
+                if affinity_cores:
+                    self.pin_process(p.pid, affinity_cores[idx % len(affinity_cores)])
                 self.processes.append(p)
             
             self.logger.info(f"Started {cores} CPU stress processes with intensity {intensity}")
@@ -217,12 +481,40 @@ class CPUStressTester:
             self.logger.error(f"Error starting CPU stress: {e}")
             raise
 
+    def shared_memory_fits(self, size):
+        """Check whether a shared memory segment of size bytes can be fully backed"""
+        if not os.path.isdir('/dev/shm'):
+            return True  # Not tmpfs-backed (Windows, macOS)
+        try:
+            return shutil.disk_usage('/dev/shm').free >= size
+        except OSError:
+            return False
+
     def stress_memory(self, processes, size_mb):
         """Start memory stress testing"""
         try:
-            for _ in range(processes):
-                p = multiprocessing.Process(target=memory_burn, args=(size_mb,))
+            # One shared segment, split into a separate size_mb region per worker. /dev/shm is
+            # often capped (64MB in Docker) and writes past the cap kill the worker with SIGBUS,
+            # so fall back to private buffers when the segment would not fit
+            region_size = size_mb * 1024 * 1024
+            if self.shared_memory_fits(processes * region_size):
+                self.shared_memory = shared_memory.SharedMemory(create=True, size=processes * region_size)
+                shm_name = self.shared_memory.name
+                self.logger.info(f"Memory workers share a {processes * size_mb}MB shared memory segment")
+            else:
+                shm_name = None
+                self.logger.info("Not enough shared memory space, memory workers use private buffers")
+            
+            affinity_cores = self._worker_cores
+            # Continue the CPU workers' sequence so memory workers take the next free CPUs
+            first = len(self.processes)
+            for idx in range(processes):
+                p = self._mp_context.Process(target=_worker_main,
+                                             args=(memory_burn, size_mb, shm_name, idx * region_size))
                 p.start()
+                self.add_to_process_group(p.pid)
+                if affinity_cores:
+                    self.pin_process(p.pid, affinity_cores[(first + idx) % len(affinity_cores)])
                 self.memory_processes.append(p)
             
             self.logger.info(f"Started {processes} memory stress processes, {size_mb}MB each")
@@ -233,6 +525,7 @@ class CPUStressTester:
 
     def run_stress_test(self, cpu_cores, duration, intensity, memory_processes=0, memory_size=100):
         """Main stress test execution"""
+        timer = None
         try:
             # Display system info
             sys_info = get_system_info()
@@ -242,6 +535,8 @@ class CPUStressTester:
             
             self.logger.info(f"Starting stress test: CPU cores={cpu_cores}, duration={duration}s, intensity={intensity}")
             
+            monitor_core = self.reserve_monitor_core(cpu_cores + memory_processes)
+            
             # Start CPU stress
             self.stress_cpu(cpu_cores, duration, intensity)
             
@@ -249,14 +544,33 @@ class CPUStressTester:
             if memory_processes > 0:
                 self.stress_memory(memory_processes, memory_size)
             
+            # Pin the tester only after the workers are started, so a worker whose own pin
+            # failed keeps the full affinity instead of inheriting the monitor core
+            if monitor_core is not None:
+                self.pin_process(os.getpid(), monitor_core)
+                self.logger.info(f"Monitor pinned to core {monitor_core}")
+            
             start_time = time.time()
             
-            # Monitoring loop
-            while self.running and (time.time() - start_time) < duration:
-                self.display_dashboard(start_time, cpu_cores, memory_size if memory_processes > 0 else 0, intensity)
-                time.sleep(1)
+            # Stop exactly when the duration elapses, independent of the dashboard refresh
+            timer = threading.Timer(duration, self.stop_on_timeout)
+            timer.daemon = True
+            timer.start()
+            
+            # Monitor on its own thread; the main thread just waits for shutdown
+            monitor = threading.Thread(
+                target=self.monitor_loop,
+                args=(start_time, cpu_cores, memory_size if memory_processes > 0 else 0, intensity),
+                daemon=True
+            )
+            monitor.start()
+            
+            # Wait in short slices so Ctrl+C is still handled promptly on Windows
+            while self.running:
+                self._stop_event.wait(1)
+            monitor.join(timeout=2)
             
-            if self.running:  # Test completed normally
+            if self.completed:  # Test completed normally
                 print("\n✅ Stress test completed successfully!")
                 self.logger.info("Stress test completed successfully")
             
@@ -267,6 +581,8 @@ class CPUStressTester:
             print(f"\n❌ Error during stress test: {e}")
             self.logger.error(f"Error during stress test: {e}")
         finally:
+            if timer is not None:
+                timer.cancel()
             self.cleanup_processes()
 
 